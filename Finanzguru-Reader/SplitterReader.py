@@ -8,58 +8,77 @@ from datetime import datetime
 
 
 def print_table(json_data, base_file_name):
-    subsequent_dicts = []
-    for key, value in json_data.items():
-        if isinstance(value, dict):
-            subsequent_dicts.append((key, value))
-        elif isinstance(value, list):
+    # Walk the nested dicts depth-first
+    pending = [(json_data, base_file_name)]
+    while pending:
+        json_data, base_file_name = pending.pop()
+        subsequent_dicts = []
+        # Create the folder if this level writes any files
+        if any(not isinstance(value, dict) for value in json_data.values()):
             os.makedirs(base_file_name, exist_ok=True)
-            with open(os.path.join(base_file_name, f"{key}.csv"), "w", newline="") as f:
-                writer = csv.writer(f)
-                if value and all(isinstance(i, dict) for i in value):
-                    headers = value[0].keys()
-                    writer.writerow(headers)
-                    for row in value:
-                        writer.writerow(row.values())
-                else:
-                    writer.writerows(value)
-        else:
-            os.makedirs(base_file_name, exist_ok=True)
-            with open(os.path.join(base_file_name, f"{key}.txt"), "w") as f:
-                f.write(str(value))
-    for key, value in subsequent_dicts:
-        print_table(value, os.path.join(base_file_name, key))
+        for key, value in json_data.items():
+            if isinstance(value, dict):
+                subsequent_dicts.append((value, os.path.join(base_file_name, key)))
+            elif isinstance(value, list):
+                with open(os.path.join(base_file_name, f"{key}.csv"), "w", newline="") as f:
+                    writer = csv.writer(f)
+                    if value and all(isinstance(i, dict) for i in value):
+                        headers = value[0].keys()
+                        writer.writerow(headers)
+                        writer.writerows(row.values() for row in value)
+                    else:
+                        writer.writerows(value)
+            else:
+                with open(os.path.join(base_file_name, f"{key}.txt"), "w") as f:
+                    f.write(str(value))
+        # Reversed so nested dicts are still written in their original order
+        pending.extend(reversed(subsequent_dicts))
 
 
 def read_json_file(file_path):
-    with open(file_path) as file:
-        data = json.load(file)
+    # Read raw bytes and let json detect the encoding
+    with open(file_path, "rb") as file:
+        data = json.loads(file.read())
     return data
 
 
 def cleanup(output_folder):
     # Move analysis/bookings.csv to the root folder, then remove all folders
     bookings_file = os.path.join(output_folder, "analysis", "bookings.csv")
-    if os.path.exists(bookings_file):
+    try:
         os.rename(bookings_file, os.path.join(output_folder, "bookings.csv"))
-    for root, dirs, files in os.walk(output_folder, topdown=False):
-        for name in dirs:
-            shutil.rmtree(os.path.join(root, name))
+    except FileNotFoundError:
+        pass
+    with os.scandir(output_folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
     return
 
 
-def main(file_path, should_cleanup=False):
-    json_data = read_json_file(file_path)
+def split_json(json_data, should_cleanup=False):
     output_folder = "Finanzguru_data_" + datetime.now().strftime("%Y-%m-%d")
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-    print_table(json_data, output_folder)
+    os.makedirs(output_folder, exist_ok=True)
     if should_cleanup:
         print("Removing all read files except bookings.csv")
         cleanup(output_folder)
+        # Subfolders would be removed again, so only write what cleanup keeps
+        kept_data = {
+            key: value for key, value in json_data.items() if not isinstance(value, dict)
+        }
+        analysis = json_data.get("analysis")
+        if isinstance(analysis, dict) and isinstance(analysis.get("bookings"), list):
+            kept_data["bookings"] = analysis["bookings"]
+        print_table(kept_data, output_folder)
+    else:
+        print_table(json_data, output_folder)
     print("Data has been written to the folder: " + output_folder)
     return output_folder
 
 
+def main(file_path, should_cleanup=False):
+    return split_json(read_json_file(file_path), should_cleanup)
+
+
 if __name__ == "__main__":
     main()
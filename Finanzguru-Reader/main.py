@@ -1,7 +1,5 @@
-import os
 import argparse
-from SplitterReader import main as read_split
-from Bookings import main as plot_bookings
+from SplitterReader import read_json_file, split_json
 
 
 def main():
@@ -13,9 +11,13 @@ def main():
         "--cleanup", help="Remove all files except bookings", action="store_true"
     )
     args = parser.parse_args()
-    bookings_folder = read_split(args.file_path, args.cleanup)
-    bookings_file = os.path.join(bookings_folder, "bookings.csv")
-    bookings = plot_bookings(bookings_file)
+    # Read the export and hand the data to both steps
+    json_data = read_json_file(args.file_path)
+    split_json(json_data, args.cleanup)
+    # Only needed after the export has been read
+    from Bookings import main as plot_bookings
+
+    bookings = plot_bookings(json_data["analysis"]["bookings"])
     return bookings
 
 
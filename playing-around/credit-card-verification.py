@@ -3,11 +3,14 @@
 import argparse
 import requests
 
+# Digit sum of 2 * d for every digit d, as used by the Luhn algorithm
+LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
 
 def calculate_luhn(number):
     digits = list(map(int, str(number)))
     odd_sum = sum(digits[-1::-2])
-    even_sum = sum([sum(divmod(2 * d, 10)) for d in digits[-2::-2]])
+    even_sum = sum(LUHN_DOUBLED[d] for d in digits[-2::-2])
     return odd_sum + even_sum
 
 
@@ -31,18 +34,16 @@ def get_status_code_info(status_code):
     response = requests.get("https://status.js.org/codes.json")
     if response.status_code == 200:
         status_codes = response.json()
-        status = status_codes.get(status_code)
         return status_codes.get(str(status_code))
     else:
         return None
 
 
 def getter(dict, value):
-    if dict.get(value, "") not in (None, "None", "N/A", ""):
-        res = str(dict.get(value, "")).title()
-    else:
+    res = dict.get(value, "")
+    if res in (None, "None", "N/A", ""):
         return None
-    return str(res)
+    return str(res).title()
 
 
 def print_card_info(card_info):
@@ -56,10 +57,9 @@ def print_card_info(card_info):
     # e.g. Chase Bank
     bank = card_info.get("bank", "N/A").get("name", "N/A")
     # United States, USD
+    country_info = card_info.get("country", "N/A")
     country = (
-        card_info.get("country", "N/A").get("name", "N/A")
-        + ", "
-        + card_info.get("country", "N/A").get("currency", "N/A")
+        country_info.get("name", "N/A") + ", " + country_info.get("currency", "N/A")
     )
     print(scheme, bank, country, sep="\n")
 
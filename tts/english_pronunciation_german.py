@@ -55,7 +55,7 @@
     'Internet of Things': 'intahnett of things',
     'Smart City': 'smahrt city',
     '5G': 'five gee',
-    'WiFi': 'wai-fai',
+    'WiFi': 'wai fai',
     'Bluetooth': 'blu-tooth',
     'USB': 'you ess bee',
     'GPS': 'gee pee ess',
@@ -71,21 +71,11 @@
     'DS': 'dee ess',
     'BD': 'bee dee',
     'CC': 'see see',
-    'VR': 'vee ar',
-    'AR': 'ay ar',
     'CS': 'see ess',
     'BC': 'bee see',
-    'CC': 'see see',
     'EV': 'ee vee',
     'SDC': 'ess dee see',
     'IoT': 'ai oh tee',
     'SC': 'ess see',
-    '5G': 'five gee',
-    'WiFi': 'wai fai',
     'BT': 'bee tee',
-    'USB': 'you ess bee',
-    'GPS': 'gee pee ess',
-    'LED': 'ell ee dee',
-    'LCD': 'ell see dee',
-    'OLED': 'oh ell ee dee',
 }
\ No newline at end of file
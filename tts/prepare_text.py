@@ -2,6 +2,7 @@ import argparse
 import sys
 import re
 import json
+from functools import lru_cache
 from num2words import num2words
 
 supported_languages = {
@@ -9,6 +10,15 @@ supported_languages = {
     'de': 'German',
 }
 
+# Precompiled patterns used by prepare_text
+YEAR_PATTERN = re.compile(r'\b\d{4}\b')
+YEAR_RANGE_PATTERN = re.compile(r'\b(\d{4})-(\d{4})\b')
+FOOTNOTE_PATTERN = re.compile(r'(?<=\w)\[\d+\](?=[\s\.]|$)')
+BRACKETED_NUMBER_PATTERN = re.compile(r'\(\d{1,3}\)')
+COLON_PAUSE_PATTERN = re.compile(r'(\w+): (\w+)')
+DASH_PAUSE_PATTERN = re.compile(r'(\w+) - (\w+)')
+NUMBER_PATTERN = re.compile(r'\b\d+\b')
+
 def year_to_words(year, language):
     # This function converts a year number into its spoken German form
     # You may need to expand this function to handle more cases
@@ -16,11 +26,25 @@ def year_to_words(year, language):
         return f"{year // 100}hundert {year % 100}"
     else:
         return f"zweitausend {year % 1000}"
+
+@lru_cache(maxsize=1)
+def load_english_pronunciation():
+    # Read the pronunciation table and build a pattern matching its words
+    with open('english_pronunciation_german.json', 'r') as file:
+        english_pronunciation_dict = json.load(file)
+
+    # Match all words in a single pass; longest first so phrases win over their parts
+    english_words = sorted(english_pronunciation_dict, key=len, reverse=True)
+    if not english_words:
+        # An empty alternation would match everywhere
+        return english_pronunciation_dict, None
+    english_pattern = re.compile('|'.join(map(re.escape, english_words)))
+    return english_pronunciation_dict, english_pattern
     
 def prepare_text(text, language):
     if language == 'de':
         # Find all four-digit numbers in the text
-        years = re.findall(r'\b\d{4}\b', text)
+        years = YEAR_PATTERN.findall(text)
         for year in years:
             # Parse the year number
             year_number = int(year)
@@ -30,7 +54,7 @@ def prepare_text(text, language):
             text = text.replace(year, year_words)
 
         # Find all year ranges in the text
-        year_ranges = re.findall(r'\b(\d{4})-(\d{4})\b', text)
+        year_ranges = YEAR_RANGE_PATTERN.findall(text)
         for start_year, end_year in year_ranges:
             # Parse the year numbers
             start_year_number = int(start_year)
@@ -43,28 +67,26 @@ def prepare_text(text, language):
         
         # Remove footnote indicators
         #             word      [number] EOL/period/whitespace
-        text = re.sub(r'(?<=\w)\[\d+\](?=[\s\.]|$)', '', text)
+        text = FOOTNOTE_PATTERN.sub('', text)
 
         # Remove numbers in brackets with three or less digits
-        text = re.sub(r'\(\d{1,3}\)', '', text)
+        text = BRACKETED_NUMBER_PATTERN.sub('', text)
         
         # Replace "something: what it is" and "something - it is what it is" with a pause marker
-        text = re.sub(r'(\w+): (\w+)', r'\1, \2', text)
-        text = re.sub(r'(\w+) - (\w+)', r'\1, \2', text)
+        text = COLON_PAUSE_PATTERN.sub(r'\1, \2', text)
+        text = DASH_PAUSE_PATTERN.sub(r'\1, \2', text)
         
         # Replace English words with their correct pronunciation
-        with open('english_pronunciation_german.json', 'r') as file:
-            english_pronunciation_dict = json.load(file)
-
-        for english_word, pronunciation in english_pronunciation_dict.items():
-            text = text.replace(english_word, pronunciation)
+        english_pronunciation_dict, english_pattern = load_english_pronunciation()
+        if english_pattern is not None:
+            text = english_pattern.sub(lambda match: english_pronunciation_dict[match.group()], text)
     
         # Your existing code...
         
     ##### End de-specific code
         
     # Convert numbers to words
-    numbers = re.findall(r'\b\d+\b', text)
+    numbers = NUMBER_PATTERN.findall(text)
     for number in numbers:
         text = text.replace(number, num2words(int(number), lang=language))
 